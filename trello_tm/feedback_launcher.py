@@ -1,24 +1,149 @@
 """Launcher for the interactive feedback UI.
 
 This module provides a function to invoke the Qt-based feedback UI implemented
-in `feedback_ui.py` as a separate subprocess, returning the collected result
-back to the caller.
+in `feedback_ui.py`, returning the collected result back to the caller.
+
+The UI runs in a long-lived worker process that is spawned on first use and
+reached over a Unix domain socket, so repeated calls do not pay the Python
+interpreter and Qt start-up cost again. If the worker cannot be reached, the UI
+is launched as a one-shot subprocess instead.
 """
 
 from __future__ import annotations
 
+import asyncio
+import atexit
+import contextlib
 import json
 import os
+import struct
 import subprocess
 import sys
 import tempfile
+import time
 
 __all__ = ["launch_feedback_ui"]
 
+# Resolved once so every spawn hands Popen an absolute executable path. Together with
+# close_fds=False and no preexec_fn/cwd/env overrides this keeps our spawns on
+# CPython's os.posix_spawn fast path, which avoids copying the (large) MCP server's
+# page tables the way fork() does. File descriptors are non-inheritable by default
+# (PEP 446), so leaving close_fds off does not leak them into the child.
+_PYTHON_EXECUTABLE = sys.executable
+_FEEDBACK_UI_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "feedback_ui.py")
+_WORKER_SOCKET_NAME = "feedback.sock"
+_WORKER_START_TIMEOUT = 10.0
+_MESSAGE_HEADER = struct.Struct(">I")
+
+_worker: subprocess.Popen | None = None
+# Private (0700) directory holding the worker socket, so no other local user can bind
+# the path before the worker does and impersonate it
+_worker_socket_dir: str | None = None
+
+
+def _worker_socket_path() -> str:
+    global _worker_socket_dir
+    if _worker_socket_dir is None:
+        _worker_socket_dir = tempfile.mkdtemp(prefix="trello_tm_feedback_")
+    return os.path.join(_worker_socket_dir, _WORKER_SOCKET_NAME)
+
+
+async def _write_message(writer: asyncio.StreamWriter, payload: dict) -> None:
+    body = json.dumps(payload).encode("utf-8")
+    writer.write(_MESSAGE_HEADER.pack(len(body)) + body)
+    await writer.drain()
+
+
+async def _read_message(reader: asyncio.StreamReader) -> dict:
+    header = await reader.readexactly(_MESSAGE_HEADER.size)
+    (length,) = _MESSAGE_HEADER.unpack(header)
+    return json.loads(await reader.readexactly(length))
+
+
+def _stop_ui_worker() -> None:
+    if _worker is not None and _worker.poll() is None:
+        _worker.terminate()
+    if _worker_socket_dir is None:
+        return
+    with contextlib.suppress(FileNotFoundError):
+        os.unlink(_worker_socket_path())
+    with contextlib.suppress(OSError):
+        os.rmdir(_worker_socket_dir)
+
+
+def _get_or_spawn_ui_worker() -> subprocess.Popen:
+    """Return the running feedback UI worker, spawning a new one if it is not alive."""
+    global _worker
+    if _worker is not None and _worker.poll() is None:
+        return _worker
+
+    # A stale socket file from a dead worker would make bind() fail in the new one
+    socket_path = _worker_socket_path()
+    with contextlib.suppress(FileNotFoundError):
+        os.unlink(socket_path)
 
-def launch_feedback_ui(project_directory: str, summary: str) -> dict[str, str]:
+    args = [
+        _PYTHON_EXECUTABLE,
+        "-u",
+        _FEEDBACK_UI_PATH,
+        "--socket",
+        socket_path,
+        "--parent-pid",
+        str(os.getpid()),
+    ]
+    _worker = subprocess.Popen(  # noqa: S603
+        args,
+        shell=False,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        stdin=subprocess.DEVNULL,
+        close_fds=False,
+    )
+    return _worker
+
+
+async def _connect_to_ui_worker() -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+    """Connect to the feedback UI worker, waiting for a freshly spawned one to start listening."""
+    worker = _get_or_spawn_ui_worker()
+    deadline = time.monotonic() + _WORKER_START_TIMEOUT
+    while True:
+        try:
+            return await asyncio.open_unix_connection(_worker_socket_path())
+        except (FileNotFoundError, ConnectionRefusedError):
+            if worker.poll() is not None or time.monotonic() > deadline:
+                raise
+            await asyncio.sleep(0.05)
+
+
+async def _launch_feedback_ui_once(project_directory: str, summary: str) -> dict[str, str]:
+    """Run the feedback UI as a one-shot subprocess and return its result."""
+    # Run feedback_ui.py as a separate process, it writes the result JSON to stdout
+    proc = await asyncio.create_subprocess_exec(
+        _PYTHON_EXECUTABLE,
+        "-u",
+        _FEEDBACK_UI_PATH,
+        "--project-directory",
+        project_directory,
+        "--prompt",
+        summary,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.DEVNULL,
+        stdin=asyncio.subprocess.DEVNULL,
+        close_fds=False,
+    )
+    stdout, _ = await proc.communicate()
+    if proc.returncode != 0:
+        raise Exception(f"Failed to launch feedback UI: {proc.returncode}")
+
+    return json.loads(stdout)
+
+
+async def launch_feedback_ui(project_directory: str, summary: str) -> dict[str, str]:
     """Launch the feedback UI and return the result.
 
+    The UI stays open until the user responds, so this only awaits the reply
+    and leaves the event loop free to serve other requests meanwhile.
+
     Args:
         project_directory: Full path to the project directory
         summary: Short summary of the changes
@@ -26,45 +151,23 @@ def launch_feedback_ui(project_directory: str, summary: str) -> dict[str, str]:
     Returns:
         Dictionary containing command_logs and interactive_feedback
     """
-    # Create a temporary file for the feedback result
-    with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as tmp:
-        output_file = tmp.name
+    try:
+        reader, writer = await _connect_to_ui_worker()
+    except OSError:
+        return await _launch_feedback_ui_once(project_directory, summary)
 
     try:
-        # Get the path to feedback_ui.py relative to this script
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        feedback_ui_path = os.path.join(script_dir, "feedback_ui.py")
-
-        # Run feedback_ui.py as a separate process
-        args = [
-            sys.executable,
-            "-u",
-            feedback_ui_path,
-            "--project-directory",
-            project_directory,
-            "--prompt",
-            summary,
-            "--output-file",
-            output_file,
-        ]
-        result = subprocess.run(  # noqa: S603
-            args,
-            check=False,
-            shell=False,
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-            stdin=subprocess.DEVNULL,
-            close_fds=True,
-        )
-        if result.returncode != 0:
-            raise Exception(f"Failed to launch feedback UI: {result.returncode}")
-
-        # Read the result from the temporary file
-        with open(output_file) as f:
-            res = json.load(f)
-        os.unlink(output_file)
-        return res
-    except Exception:
-        if os.path.exists(output_file):
-            os.unlink(output_file)
-        raise
+        await _write_message(writer, {"project_directory": project_directory, "summary": summary})
+        return await _read_message(reader)
+    except (OSError, asyncio.IncompleteReadError) as e:
+        print(f"Feedback UI worker failed, falling back to a one-shot window: {e}", file=sys.stderr)
+    finally:
+        writer.close()
+        with contextlib.suppress(OSError):
+            await writer.wait_closed()
+
+    # The worker died before replying, show the window from a one-shot process instead
+    return await _launch_feedback_ui_once(project_directory, summary)
+
+
+atexit.register(_stop_ui_worker)
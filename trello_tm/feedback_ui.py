@@ -6,6 +6,8 @@ import contextlib
 import hashlib
 import json
 import os
+import socket
+import struct
 import subprocess
 import sys
 import threading
@@ -28,6 +30,8 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+MESSAGE_HEADER = struct.Struct(">I")
+
 
 class FeedbackResult(TypedDict):
     command_logs: str
@@ -432,21 +436,67 @@ def get_project_settings_group(project_dir: str) -> str:
     return f"{basename}_{full_hash}"
 
 
-def feedback_ui(project_directory: str, prompt: str, output_file: str | None = None) -> FeedbackResult | None:
+def feedback_ui(project_directory: str, prompt: str) -> FeedbackResult:
     app = QApplication.instance() or QApplication()
     app.setStyle("Fusion")
     ui = FeedbackUI(project_directory, prompt)
-    result = ui.run()
+    return ui.run()
+
+
+def read_message(conn: socket.socket) -> dict:
+    # Messages are length-prefixed JSON: a 4-byte big-endian size followed by the body
+    with conn.makefile("rb") as reader:
+        header = reader.read(MESSAGE_HEADER.size)
+        if len(header) < MESSAGE_HEADER.size:
+            raise ConnectionError("Client closed the connection")
+        (length,) = MESSAGE_HEADER.unpack(header)
+        body = reader.read(length)
+    if len(body) < length:
+        raise ConnectionError("Client closed the connection")
+    return json.loads(body)
 
-    if output_file and result:
-        # Ensure the directory exists
-        os.makedirs(os.path.dirname(output_file) if os.path.dirname(output_file) else ".", exist_ok=True)
-        # Save the result to the output file
-        with open(output_file, "w") as f:
-            json.dump(result, f)
-        return None
 
-    return result
+def write_message(conn: socket.socket, payload: dict) -> None:
+    body = json.dumps(payload).encode("utf-8")
+    conn.sendall(MESSAGE_HEADER.pack(len(body)) + body)
+
+
+def serve(socket_path: str, parent_pid: int | None = None) -> None:
+    """Show a feedback window for every request received on the socket.
+
+    Keeps a single QApplication alive between requests and exits once the
+    parent process is gone.
+    """
+    app = QApplication.instance() or QApplication()
+    app.setStyle("Fusion")
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(socket_path)
+    server.listen()
+    # Wake up periodically to check whether the parent is still running and to
+    # pump Qt events, so macOS doesn't flag the idle worker as not responding
+    server.settimeout(0.5)
+    try:
+        while parent_pid is None or psutil.pid_exists(parent_pid):
+            app.processEvents()
+            try:
+                conn, _ = server.accept()
+            except TimeoutError:
+                continue
+            with conn:
+                # A bad request must not take down the worker for later ones
+                try:
+                    request = read_message(conn)
+                    ui = FeedbackUI(request["project_directory"], request["summary"])
+                    write_message(conn, ui.run())
+                except Exception as e:
+                    print(f"Feedback request failed: {e}", file=sys.stderr)
+                    with contextlib.suppress(OSError):
+                        write_message(conn, {"error": f"Feedback request failed: {e}"})
+    finally:
+        server.close()
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(socket_path)
 
 
 if __name__ == "__main__":
@@ -455,11 +505,16 @@ if __name__ == "__main__":
     parser.add_argument(
         "--prompt", default="I implemented the changes you requested.", help="The prompt to show to the user"
     )
-    parser.add_argument("--output-file", help="Path to save the feedback result as JSON")
+    parser.add_argument("--socket", help="Serve feedback requests on this Unix domain socket instead")
+    parser.add_argument("--parent-pid", type=int, help="Exit the socket server once this process is gone")
     args = parser.parse_args()
 
-    result = feedback_ui(args.project_directory, args.prompt, args.output_file)
-    if result:
-        print(f"\nLogs collected: \n{result['logs']}")
-        print(f"\nFeedback received:\n{result['interactive_feedback']}")
+    if args.socket:
+        serve(args.socket, args.parent_pid)
+        sys.exit(0)
+
+    result = feedback_ui(args.project_directory, args.prompt)
+    # The launcher reads the result as JSON from stdout
+    sys.stdout.buffer.write(json.dumps(result).encode("utf-8"))
+    sys.stdout.flush()
     sys.exit(0)
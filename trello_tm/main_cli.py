@@ -1,16 +1,28 @@
 import asyncio
+import functools
 import os
 
 from dotenv import load_dotenv
 from mcp.server.fastmcp import Context, FastMCP
 
 from trello_tm.feedback_launcher import launch_feedback_ui
-from trello_tm.trello_task_manager import TrelloTaskManager
+from trello_tm.trello_task_manager import VALID_FILTERS, TrelloTaskManager, get_manager
 
-load_dotenv()
+# TrelloTaskManager keeps per-call state, so its calls run one at a time
+_manager_lock = asyncio.Lock()
 
 
-def handle_task_operation(operation_func, error_prefix: str, *args):
+async def run_manager_call(func, *args):
+    """Run a blocking TrelloTaskManager call in a worker thread.
+
+    HTTP requests and rate limit back-off then no longer stall the event loop
+    serving other MCP requests.
+    """
+    async with _manager_lock:
+        return await asyncio.to_thread(func, *args)
+
+
+async def handle_task_operation(operation_func, error_prefix: str, *args):
     """Generic handler for task operations.
 
     Args:
@@ -22,15 +34,30 @@ def handle_task_operation(operation_func, error_prefix: str, *args):
         Operation result message
     """
     try:
-        _, message = operation_func(*args)
+        return (await run_manager_call(operation_func, *args))[1]
     except Exception as e:
         return f"{error_prefix}: {e!s}"
-    else:
-        return message
 
 
 def _create_basic_task_tools(mcp: FastMCP, manager: TrelloTaskManager):
     """Create basic task management tools."""
+    # Bind each operation and its error prefix once instead of on every tool call
+    run_add_task = functools.partial(handle_task_operation, manager.add_task, "Error adding task")
+    run_get_next_task = functools.partial(
+        handle_task_operation, manager.get_next_task, "Error getting next available task"
+    )
+    run_mark_as_in_progress = functools.partial(
+        handle_task_operation, manager.mark_as_in_progress, "Error marking task as in progress"
+    )
+    run_mark_as_completed = functools.partial(
+        handle_task_operation, manager.mark_as_completed, "Error marking task as completed"
+    )
+    run_mark_many_as_completed = functools.partial(
+        handle_task_operation, manager.mark_many_as_completed, "Error marking tasks as completed"
+    )
+    run_update_task_description = functools.partial(
+        handle_task_operation, manager.update_task_description, "Error updating task description"
+    )
 
     @mcp.tool()
     async def add_task(ctx: Context, project_name: str, title: str, description: str) -> str:
@@ -44,7 +71,7 @@ def _create_basic_task_tools(mcp: FastMCP, manager: TrelloTaskManager):
         Returns:
             Confirmation message
         """
-        return handle_task_operation(manager.add_task, "Error adding task", project_name, title, description)
+        return await run_add_task(project_name, title, description)
 
     @mcp.tool()
     async def get_next_available_task(ctx: Context, project_name: str) -> str:
@@ -58,7 +85,7 @@ def _create_basic_task_tools(mcp: FastMCP, manager: TrelloTaskManager):
         Returns:
             The name of the next available task or a message if no task is available.
         """
-        return handle_task_operation(manager.get_next_task, "Error getting next available task", project_name)
+        return await run_get_next_task(project_name)
 
     @mcp.tool()
     async def mark_as_in_progress(ctx: Context, project_name: str, title: str) -> str:
@@ -71,9 +98,7 @@ def _create_basic_task_tools(mcp: FastMCP, manager: TrelloTaskManager):
         Returns:
             Confirmation message
         """
-        return handle_task_operation(
-            manager.mark_as_in_progress, "Error marking task as in progress", project_name, title
-        )
+        return await run_mark_as_in_progress(project_name, title)
 
     @mcp.tool()
     async def mark_as_completed(ctx: Context, project_name: str, title: str) -> str:
@@ -86,7 +111,20 @@ def _create_basic_task_tools(mcp: FastMCP, manager: TrelloTaskManager):
         Returns:
             Confirmation message
         """
-        return handle_task_operation(manager.mark_as_completed, "Error marking task as completed", project_name, title)
+        return await run_mark_as_completed(project_name, title)
+
+    @mcp.tool()
+    async def mark_many_as_completed(ctx: Context, project_name: str, titles: list[str]) -> str:
+        """Mark several tasks as completed at once.
+
+        Args:
+            project_name: Name of the project
+            titles: Titles of the tasks to be marked as completed
+
+        Returns:
+            Confirmation message
+        """
+        return await run_mark_many_as_completed(project_name, titles)
 
     @mcp.tool()
     async def update_task_description(ctx: Context, project_name: str, title: str, description: str) -> str:
@@ -100,13 +138,22 @@ def _create_basic_task_tools(mcp: FastMCP, manager: TrelloTaskManager):
         Returns:
             Confirmation message
         """
-        return handle_task_operation(
-            manager.update_task_description, "Error updating task description", project_name, title, description
-        )
+        return await run_update_task_description(project_name, title, description)
 
 
 def _create_checklist_tools(mcp: FastMCP, manager: TrelloTaskManager):
     """Create checklist management tools."""
+    run_update_task_with_checklist = functools.partial(
+        handle_task_operation, manager.update_task_with_checklist, "Error updating task with checklist"
+    )
+    run_complete_checklist_item = functools.partial(
+        handle_task_operation, manager.complete_checklist_item, "Error completing checklist item"
+    )
+    run_get_next_unchecked_checklist_item = functools.partial(
+        handle_task_operation,
+        manager.get_next_unchecked_checklist_item,
+        "Error getting next unchecked checklist item",
+    )
 
     @mcp.tool()
     async def update_task_with_checklist(
@@ -125,13 +172,7 @@ def _create_checklist_tools(mcp: FastMCP, manager: TrelloTaskManager):
         Returns:
             Confirmation message
         """
-        return handle_task_operation(
-            manager.update_task_with_checklist,
-            "Error updating task with checklist",
-            project_name,
-            title,
-            checklist_items,
-        )
+        return await run_update_task_with_checklist(project_name, title, checklist_items)
 
     @mcp.tool()
     async def complete_checklist_item(ctx: Context, project_name: str, title: str, checklist_item_name: str) -> str:
@@ -145,13 +186,7 @@ def _create_checklist_tools(mcp: FastMCP, manager: TrelloTaskManager):
         Returns:
             Confirmation message
         """
-        return handle_task_operation(
-            manager.complete_checklist_item,
-            "Error completing checklist item",
-            project_name,
-            title,
-            checklist_item_name,
-        )
+        return await run_complete_checklist_item(project_name, title, checklist_item_name)
 
     @mcp.tool()
     async def get_next_unchecked_checklist_item(ctx: Context, project_name: str, title: str) -> str:
@@ -164,12 +199,7 @@ def _create_checklist_tools(mcp: FastMCP, manager: TrelloTaskManager):
         Returns:
             The name of the next unchecked checklist item or an error message
         """
-        return handle_task_operation(
-            manager.get_next_unchecked_checklist_item,
-            "Error getting next unchecked checklist item",
-            project_name,
-            title,
-        )
+        return await run_get_next_unchecked_checklist_item(project_name, title)
 
 
 def _create_task_query_tools(mcp: FastMCP, manager: TrelloTaskManager):
@@ -186,26 +216,30 @@ def _create_task_query_tools(mcp: FastMCP, manager: TrelloTaskManager):
         Returns:
             A formatted list of tasks matching the filter criteria
         """
+        # Reject unknown filters before fetching anything from Trello
+        if filter_type not in VALID_FILTERS:
+            return f"Invalid filter_type: {filter_type!r}. Expected one of {sorted(VALID_FILTERS)}."
+
         try:
-            tasks, message = manager.get_tasks(project_name, filter_type)
+            tasks, message = await run_manager_call(manager.get_tasks, project_name, filter_type)
             if not tasks:
                 return message
 
             # Format the tasks for display
-            result = [message]
-            for _i, task in enumerate(tasks, 1):
-                result.append(f"Task title: '{task['name']}'")
-                result.append(f"Task status: '{task['status']}'")
-                result.append(f"Task description: {task['description']}")
+            rows = [
+                f"Task title: '{task['name']}'\nTask status: '{task['status']}'\nTask description: {task['description']}"
+                for task in tasks
+            ]
 
-            return "\n".join(result)
+            return "\n".join([message, *rows])
         except Exception as e:
             return f"Error getting tasks: {e!s}"
 
 
 def first_line(text: str) -> str:
     """Extract the first line from text."""
-    return text.split("\n")[0].strip()
+    head, _, _ = text.partition("\n")
+    return head.strip()
 
 
 def _create_feedback_tools(mcp: FastMCP):
@@ -223,7 +257,7 @@ def _create_feedback_tools(mcp: FastMCP):
             Dictionary containing command logs and interactive feedback
         """
         try:
-            return launch_feedback_ui(first_line(project_directory), first_line(summary))
+            return await launch_feedback_ui(first_line(project_directory), first_line(summary))
         except Exception as e:
             return {"error": f"Error launching feedback UI: {e!s}"}
 
@@ -250,11 +284,11 @@ def create_mcp() -> FastMCP:
     mcp = FastMCP(
         "TASK MANAGER",
         host=os.getenv("HOST", "127.0.0.1"),
-        port=os.getenv("PORT", 8050),
+        port=int(os.getenv("PORT", "8050")),
         instructions="Trello Task Manager",
     )
 
-    manager = TrelloTaskManager()
+    manager = get_manager()
     create_task_tools(mcp, manager)
 
     return mcp
@@ -264,7 +298,7 @@ async def async_main():
     # Create a fresh MCP instance
     mcp = create_mcp()
 
-    transport = os.getenv("TRANSPORT", "sse")
+    transport = os.getenv("TRANSPORT", "stdio")
     if transport == "sse":
         # Run the MCP server with SSE transport using a custom uvicorn runner
         # to allow configurable aggressive shutdown and true forced quit.
@@ -316,6 +350,8 @@ async def async_main():
 
 
 def main():
+    # Read .env only when actually starting the server, not on every import
+    load_dotenv()
     asyncio.run(async_main())
 
 
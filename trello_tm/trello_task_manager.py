@@ -1,39 +1,132 @@
 import datetime
+import functools
+import hashlib
+import json
 import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 
+import requests
 from dotenv import load_dotenv
-from trello import TrelloClient
-
-load_dotenv()
-
-TRELLO_API_KEY = os.getenv("TRELLO_API_KEY")
-TRELLO_API_TOKEN = os.getenv("TRELLO_API_TOKEN")
-BOARD_NAME_TO_MATCH = os.getenv("TRELLO_BOARD_NAME")
+from requests.adapters import HTTPAdapter
+from trello import Board, Checklist, Label, List, ResourceUnavailable, TrelloClient
+from urllib3.util import Retry
 
 # Default label definitions
 DEFAULT_LABELS = {"WIP": "blue"}
 WIP_LABEL_NAME = "WIP"
 DEFAULT_CHECKLIST_NAME = "Checklist"
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+# Card fields read by get_tasks/get_next_task, so they never need a per-card fetch()
+TASK_CARD_FIELDS = "name,desc,dueComplete,idLabels"
+# The card fields py-trello's Card.from_json reads, requested instead of every card field
+CARD_LOOKUP_FIELDS = (
+    "name,desc,due,dueComplete,closed,url,pos,shortUrl,idMembers,idLabels,idBoard,idList,idShort,"
+    "badges,idChecklists,labels,dateLastActivity"
+)
+LIST_LOOKUP_FIELDS = "name,closed,pos"
+# How long a list's cards are reused for title lookups before being downloaded again
+CARD_CACHE_TTL = 30.0
+# Board and label ids resolved on a previous start, so a new process can skip looking them up
+BOARD_META_CACHE_PATH = os.path.join(
+    os.getenv("XDG_CACHE_HOME", os.path.expanduser("~/.cache")), "trello_tm", "meta.json"
+)
+BOARD_META_CACHE_TTL = 24 * 60 * 60
+# Task status a filter selects; "all" selects every status
+STATUS_FOR_FILTER = {"wip": "wip", "done": "done"}
+VALID_FILTERS = frozenset({"all", *STATUS_FOR_FILTER})
+NO_TASKS_MESSAGES = {
+    "all": "No tasks found in project '{project_name}'.",
+    "wip": "No work in progress tasks found in project '{project_name}'.",
+    "done": "No completed tasks found in project '{project_name}'.",
+}
+FOUND_TASKS_MESSAGES = {
+    "all": "Found {task_count} task(s) in project '{project_name}'.",
+    "wip": "Found {task_count} work in progress task(s) in project '{project_name}'.",
+    "done": "Found {task_count} completed task(s) in project '{project_name}'.",
+}
+# Concurrent requests for bulk operations, kept within the HTTP session's connection pool
+MAX_PARALLEL_REQUESTS = 16
+# Gap between the positions given to checklist items that are created together
+CHECKLIST_POS_STEP = 1024
 
 
 class TaskNotFoundError(Exception):
     def __init__(self, project_name, title):
         self.project_name = project_name
         self.title = title
-        super().__init__(f"Task '{title}' not found in project '{project_name}'.")
+        super().__init__(project_name, title)
+
+    def __str__(self):
+        return f"Task '{self.title}' not found in project '{self.project_name}'."
 
 
 class ChecklistNotFoundError(Exception):
     def __init__(self, checklist_name, title):
         self.checklist_name = checklist_name
         self.title = title
-        super().__init__(f"Checklist '{checklist_name}' not found for task '{title}'.")
+        super().__init__(checklist_name, title)
+
+    def __str__(self):
+        return f"Checklist '{self.checklist_name}' not found for task '{self.title}'."
 
 
 class ChecklistItemNotFoundError(Exception):
     def __init__(self, title):
         self.title = title
-        super().__init__(f"No unchecked checklist items found for task '{title}'.")
+        super().__init__(title)
+
+    def __str__(self):
+        return f"No unchecked checklist items found for task '{self.title}'."
+
+
+@dataclass(frozen=True)
+class TrelloConfig:
+    api_key: str
+    api_token: str
+    board_name: str
+
+
+@functools.lru_cache(maxsize=1)
+def get_trello_config():
+    """Read the Trello settings from the environment and .env once, failing fast if one is missing."""
+    load_dotenv()
+    return TrelloConfig(
+        api_key=os.environ["TRELLO_API_KEY"],
+        api_token=os.environ["TRELLO_API_TOKEN"],
+        board_name=os.environ["TRELLO_BOARD_NAME"],
+    )
+
+
+class BulkCompletionError(Exception):
+    def __init__(self, project_name, completed, failed):
+        self.project_name = project_name
+        self.completed = completed
+        self.failed = failed
+        super().__init__(project_name, completed, failed)
+
+    def __str__(self):
+        failures = "; ".join(f"'{title}': {error}" for title, error in self.failed.items())
+        completed = ", ".join(f"'{title}'" for title in self.completed) or "none"
+        return (
+            f"{len(self.failed)} task(s) in project '{self.project_name}' could not be completed ({failures}). "
+            f"Completed: {completed}."
+        )
+
+
+class RateLimitRetry(Retry):
+    """Retry that also replays POSTs, but only when Trello rejected them with 429.
+
+    A 429 means the request was never processed, so repeating it cannot create a
+    duplicate card or checklist item. Other errors still only retry idempotent methods.
+    """
+
+    def is_retry(self, method, status_code, has_retry_after=False):
+        if status_code == 429:
+            return bool(self.total)
+        return super().is_retry(method, status_code, has_retry_after)
 
 
 class TrelloTaskManager:
@@ -41,126 +134,161 @@ class TrelloTaskManager:
     wip_label = None
 
     def __init__(self):
+        config = get_trello_config()
+        self.board_name = config.board_name
+        # Board cache entries are scoped to the credentials, so another account's board of
+        # the same name is never picked up. Only a hash of them is written to disk.
+        credentials_hash = hashlib.sha256(f"{config.api_key}:{config.api_token}".encode()).hexdigest()[:16]
+        self._board_meta_key = f"{credentials_hash}:{config.board_name}"
+        self.session = self._create_session()
         self.client = TrelloClient(
-            api_key=TRELLO_API_KEY,
-            api_secret=TRELLO_API_TOKEN,
-        )
-        self.selected_board = next(
-            (board for board in self.client.list_boards() if board.name == BOARD_NAME_TO_MATCH), None
+            api_key=config.api_key,
+            api_secret=config.api_token,
+            http_service=self.session,
         )
+        self.selected_board = None
         self.labels = {}
-        if self.selected_board:
-            self._create_default_labels()
+        # list id -> (fetched at, {card name: card})
+        self._list_cache = {}
+        # (fetched at, {list name: list}) for the selected board
+        self._lists_by_name = None
+        # Whether the board and label ids came from the on-disk cache and may be stale
+        self._board_meta_cached = self._load_board_meta()
+        if not self._board_meta_cached:
+            self._select_board()
 
     def add_task(self, project_name, title, description):
         self.selected_board_list = self._find_existing_list(project_name)
 
         if self.selected_board_list is None:
             self.selected_board_list = self.selected_board.add_list(project_name)
-
-        card_added = self.selected_board_list.add_card(name=f"{title}", desc=description, position="bottom")
+            self._lists_by_name[1][project_name] = self.selected_board_list
+
+        # Post the card directly: List.add_card also sends a batch of unused null fields and
+        # parses the response into a Card, which nothing here needs
+        card_added = self.client.fetch_json(
+            "/cards",
+            http_method="POST",
+            post_args={"idList": self.selected_board_list.id, "name": title, "desc": description, "pos": "bottom"},
+        )
+        self._invalidate_cards(self.selected_board_list.id)
         return card_added, f"Added new task '{title}' to {project_name}"
 
     def get_next_task(self, project_name):
         wip_label = self.labels.get(WIP_LABEL_NAME)
         if not wip_label:
-            return "WIP label has not been set up on the board."
+            return None, "WIP label has not been set up on the board."
 
+        wip_id = wip_label.id
         self.selected_board_list = self._find_existing_list(project_name)
-        for card in self.selected_board_list.list_cards():
-            card.fetch()
-
-            has_wip = any(label.id == wip_label.id for label in card.labels)
+        for card in self._list_cards_full(self.selected_board_list.id):
+            has_wip = wip_id in card["idLabels"]
 
-            if not has_wip and not card.is_due_complete:
+            if not has_wip and not card["dueComplete"]:
                 return card, "\n".join([
                     "Next available task:",
-                    f"Task title: '{card.name}'",
-                    f"Task description: {card.description}",
+                    f"Task title: '{card['name']}'",
+                    f"Task description: {card['desc']}",
                 ])
 
         return None, f"No available tasks found in '{project_name}'."
 
     def mark_as_in_progress(self, project_name, title):
-        self.selected_board_list = self._find_existing_list(project_name)
-        card_to_update = next((card for card in self.selected_board_list.list_cards() if card.name == title), None)
-        if not card_to_update:
-            raise TaskNotFoundError(project_name, title)
+        card_to_update = self._find_card(project_name, title)
 
         if WIP_LABEL_NAME in self.labels:
-            card_to_update.add_label(self.labels[WIP_LABEL_NAME])
+            self._retry_with_fresh_board_meta(lambda: card_to_update.add_label(self.labels[WIP_LABEL_NAME]))
+            self._invalidate_cards(card_to_update.idList)
 
         return card_to_update, f"Task '{title}' in project '{project_name}' marked as in progress."
 
     def mark_as_completed(self, project_name, title):
-        self.selected_board_list = self._find_existing_list(project_name)
-        card_to_close = next((card for card in self.selected_board_list.list_cards() if card.name == title), None)
-        if not card_to_close:
-            raise TaskNotFoundError(project_name, title)
-
-        if WIP_LABEL_NAME in self.labels and self.labels[WIP_LABEL_NAME] in card_to_close.labels:
-            card_to_close.remove_label(self.labels[WIP_LABEL_NAME])
-        card_to_close.set_due_complete()
+        card_to_close = self._find_card(project_name, title)
+        self._complete_card(card_to_close)
+        self._invalidate_cards(card_to_close.idList)
 
         return card_to_close, f"Task '{title}' in project '{project_name}' has been completed."
 
-    def update_task_description(self, project_name, title, description):
-        self.selected_board_list = self._find_existing_list(project_name)
-        card_to_update = next((card for card in self.selected_board_list.list_cards() if card.name == title), None)
-        if not card_to_update:
-            raise TaskNotFoundError(project_name, title)
+    def mark_many_as_completed(self, project_name, titles):
+        # Complete each card once even if its title is repeated
+        titles = list(dict.fromkeys(titles))
+        # Resolve every title first so a typo fails before anything is changed
+        cards_to_close = [self._find_card(project_name, title) for title in titles]
+        try:
+            with ThreadPoolExecutor(max_workers=MAX_PARALLEL_REQUESTS) as executor:
+                futures = {
+                    title: executor.submit(self._complete_card, card) for title, card in zip(titles, cards_to_close)
+                }
+        finally:
+            for list_id in {card.idList for card in cards_to_close}:
+                self._invalidate_cards(list_id)
+
+        # Every completion has run by now; report which ones failed rather than just the first error
+        failed = {title: future.exception() for title, future in futures.items() if future.exception()}
+        if failed:
+            completed = [title for title in futures if title not in failed]
+            raise BulkCompletionError(project_name, completed, failed)
+
+        return cards_to_close, f"{len(cards_to_close)} task(s) in project '{project_name}' have been completed."
 
-        # Fetch current description to preserve it
-        card_to_update.fetch()
-        existing_description = card_to_update.description or ""
+    def update_task_description(self, project_name, title, description):
+        lookup_started = time.monotonic()
+        card_to_update = self._find_card(project_name, title)
+
+        # Preserve the current description. If the lookup just downloaded the list, the card
+        # already carries it; an older cached copy could be stale and would overwrite recent
+        # edits, so then only desc is fetched.
+        if self._list_cache[card_to_update.idList][0] >= lookup_started:
+            existing_description = card_to_update.desc or ""
+        else:
+            existing_description = (
+                self.client.fetch_json(f"/cards/{card_to_update.id}", query_params={"fields": "desc"})["desc"] or ""
+            )
 
         # Add timestamp and new description
-        timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        timestamp = time.strftime(TIMESTAMP_FORMAT)
         if existing_description:
             updated_description = f"{existing_description}\n\n--- Updated on {timestamp} ---\n{description}"
         else:
             updated_description = f"--- Created on {timestamp} ---\n{description}"
 
         card_to_update.set_description(updated_description)
+        self._invalidate_cards(card_to_update.idList)
 
         return card_to_update, f"Description updated for task '{title}' in project '{project_name}'."
 
     def update_task_with_checklist(self, project_name, title, checklist_items):
-        self.selected_board_list = self._find_existing_list(project_name)
-        card_to_update = next((card for card in self.selected_board_list.list_cards() if card.name == title), None)
-        if not card_to_update:
-            raise TaskNotFoundError(project_name, title)
+        card_to_update = self._find_card(project_name, title)
 
         # Fetch existing checklists to check if one already exists
-        card_to_update.fetch_checklists()
-
         existing_checklist = None
-        for checklist in card_to_update.checklists:
+        for checklist in self._fetch_checklists(card_to_update):
             if checklist.name == DEFAULT_CHECKLIST_NAME:
                 existing_checklist = checklist
                 break
 
         if existing_checklist:
-            # Append items to existing checklist
-            for item in checklist_items:
-                existing_checklist.add_checklist_item(item)
+            # Append items to existing checklist, after its current last item
+            last_pos = max((item.get("pos", 0) for item in existing_checklist.items), default=0)
+            self._add_checklist_items(existing_checklist.id, checklist_items, last_pos)
             return (
                 card_to_update,
                 f"Items appended to existing checklist in task '{title}' in project '{project_name}'.",
             )
         else:
-            # Create new checklist if none exists
-            card_to_update.add_checklist(DEFAULT_CHECKLIST_NAME, checklist_items)
+            # Create new checklist if none exists. Card.add_checklist would add the items one
+            # at a time and then re-fetch the whole card, neither of which is needed here.
+            new_checklist = self.client.fetch_json(
+                f"/cards/{card_to_update.id}/checklists", http_method="POST", post_args={"name": DEFAULT_CHECKLIST_NAME}
+            )
+            self._invalidate_cards(card_to_update.idList)
+            self._add_checklist_items(new_checklist["id"], checklist_items)
             return card_to_update, f"New checklist created for task '{title}' in project '{project_name}'."
 
     def complete_checklist_item(self, project_name, title, checklist_item_name):
-        self.selected_board_list = self._find_existing_list(project_name)
-        card_to_update = next((card for card in self.selected_board_list.list_cards() if card.name == title), None)
-        if not card_to_update:
-            raise TaskNotFoundError(project_name, title)
+        card_to_update = self._find_card(project_name, title)
 
-        card_to_update.fetch_checklists()
-        for checklist in card_to_update.checklists:
+        for checklist in self._fetch_checklists(card_to_update):
             if checklist.name == DEFAULT_CHECKLIST_NAME:
                 checklist.set_checklist_item(checklist_item_name, True)
                 return (
@@ -171,14 +299,9 @@ class TrelloTaskManager:
         raise ChecklistNotFoundError(DEFAULT_CHECKLIST_NAME, title)
 
     def get_next_unchecked_checklist_item(self, project_name, title):
-        self.selected_board_list = self._find_existing_list(project_name)
-        card_to_check = next((card for card in self.selected_board_list.list_cards() if card.name == title), None)
-        if not card_to_check:
-            raise TaskNotFoundError(project_name, title)
-
-        card_to_check.fetch_checklists()
+        card_to_check = self._find_card(project_name, title)
 
-        for checklist in card_to_check.checklists:
+        for checklist in self._fetch_checklists(card_to_check):
             if checklist.name == DEFAULT_CHECKLIST_NAME:
                 # Find the first unchecked item
                 for item in checklist.items:
@@ -192,14 +315,16 @@ class TrelloTaskManager:
         raise ChecklistNotFoundError(DEFAULT_CHECKLIST_NAME, title)
 
     def get_tasks(self, project_name, filter_type="all"):
+        if filter_type not in VALID_FILTERS:
+            raise ValueError(f"Invalid filter_type: {filter_type!r}. Expected one of {sorted(VALID_FILTERS)}.")
         self.selected_board_list = self._find_existing_list(project_name)
-        cards = self.selected_board_list.list_cards()
+        cards = self._list_cards_full(self.selected_board_list.id)
         filtered_tasks = []
         wip_label = self.labels.get(WIP_LABEL_NAME)
+        wip_id = wip_label.id if wip_label else None
 
         for card in cards:
-            card.fetch()
-            status = self._get_task_status(card, wip_label)
+            status = self._get_task_status(card, wip_id)
 
             if self._should_include_task(status, filter_type):
                 filtered_tasks.append(self._create_task_dict(card, status))
@@ -210,56 +335,125 @@ class TrelloTaskManager:
     def delete_all_tasks(self, project_name: str) -> str:
         self.selected_board_list = self._find_existing_list(project_name)
         cards = self.selected_board_list.list_cards()
-        for c in cards:
-            c.delete()
+        try:
+            with ThreadPoolExecutor(max_workers=MAX_PARALLEL_REQUESTS) as executor:
+                list(executor.map(lambda c: c.delete(), cards))
+        finally:
+            self._invalidate_cards(self.selected_board_list.id)
 
         return f"All tasks in project '{project_name}' have been deleted."
 
+    @staticmethod
+    def _create_session():
+        """Create an HTTP session that keeps Trello connections alive between API calls."""
+        session = requests.Session()
+        # raise_on_status=False hands the final failed response back to py-trello,
+        # so errors still surface as its usual ResourceUnavailable with the body.
+        # Trello rate limits per 10s window, so retry at once, then back off 2s, 4s and 8s
+        # (14s in all) and honour Retry-After.
+        retries = RateLimitRetry(
+            total=4, backoff_factor=1.0, status_forcelist=[429, 500, 502, 503, 504], raise_on_status=False
+        )
+        session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retries))
+        return session
+
+    def _add_checklist_items(self, checklist_id, items, last_pos=0):
+        """Create checklist items concurrently, with explicit positions so they keep their order."""
+
+        def add_item(position, name):
+            return self.client.fetch_json(
+                f"/checklists/{checklist_id}/checkItems",
+                http_method="POST",
+                post_args={"name": name, "checked": False, "pos": last_pos + CHECKLIST_POS_STEP * position},
+            )
+
+        with ThreadPoolExecutor(max_workers=MAX_PARALLEL_REQUESTS) as executor:
+            return list(executor.map(add_item, range(1, len(items) + 1), items))
+
+    def _complete_card(self, card):
+        """Mark a card as done and drop its WIP label."""
+        updated_card = self._update_card_fields(card, dueComplete=True)
+        # The card may come from the cached index, so decide on the labels the PUT returned and
+        # remove only the WIP label; rewriting idLabels would drop labels added in Trello since
+        wip_label = self.labels.get(WIP_LABEL_NAME)
+        if wip_label and wip_label.id in updated_card["idLabels"]:
+            self.client.fetch_json(f"/cards/{card.id}/idLabels/{wip_label.id}", http_method="DELETE")
+
+    def _update_card_fields(self, card, **fields):
+        """Apply several card field changes with one PUT /cards/{id}."""
+        return self.client.fetch_json(f"/cards/{card.id}", http_method="PUT", post_args=fields)
+
+    def _find_card(self, project_name, title):
+        """Return the card titled `title` in the project's list, raising TaskNotFoundError if absent."""
+        lookup_started = time.monotonic()
+        self.selected_board_list = self._find_existing_list(project_name)
+        card = None
+        board_list = self.selected_board_list
+        if board_list is not None:
+            card = self._get_cards_by_name(board_list).get(title)
+            # A cached index misses cards created or renamed in Trello since it was downloaded,
+            # so re-read the list once before giving up, unless it was just downloaded
+            if not card and self._list_cache[board_list.id][0] < lookup_started:
+                self._invalidate_cards(board_list.id)
+                card = self._get_cards_by_name(board_list).get(title)
+        if not card:
+            raise TaskNotFoundError(project_name, title)
+        return card
+
+    def _fetch_checklists(self, card):
+        """Fetch a card's checklists, sorted by position.
+
+        Card.fetch_checklists() skips the request when the card's checklist count is 0,
+        which a cached card may still report after checklists were added in Trello.
+        """
+        json_checklists = self.client.fetch_json(f"/cards/{card.id}/checklists")
+        return [
+            Checklist(self.client, json_checklist, trello_card=card.id)
+            for json_checklist in sorted(json_checklists, key=lambda checklist: checklist["pos"])
+        ]
+
+    def _get_cards_by_name(self, board_list):
+        """Return the list's cards indexed by name, reusing a recent download if there is one."""
+        cached = self._list_cache.get(board_list.id)
+        if cached and time.monotonic() - cached[0] < CARD_CACHE_TTL:
+            return cached[1]
+
+        cards_by_name = {}
+        for card in board_list.list_cards(query={"fields": CARD_LOOKUP_FIELDS}):
+            # Keep the first card for duplicate titles, as the linear scan used to
+            cards_by_name.setdefault(card.name, card)
+        self._list_cache[board_list.id] = (time.monotonic(), cards_by_name)
+        return cards_by_name
+
+    def _invalidate_cards(self, list_id):
+        """Drop the cached cards of a list after one of them has been changed."""
+        self._list_cache.pop(list_id, None)
+
+    def _list_cards_full(self, list_id):
+        """Fetch the open cards of a list with only the fields the task views need, in one request."""
+        return self.client.fetch_json(f"/lists/{list_id}/cards", query_params={"fields": TASK_CARD_FIELDS})
+
     def _create_task_dict(self, card, status):
         """Create a task dictionary from a card."""
-        return {"name": card.name, "description": card.description, "status": status, "id": card.id}
+        return {"name": card["name"], "description": card["desc"], "status": status, "id": card["id"]}
 
-    def _get_task_status(self, card, wip_label):
+    def _get_task_status(self, card, wip_id):
         """Determine the status of a task card."""
-        has_wip = False
-        if wip_label:
-            has_wip = any(label.id == wip_label.id for label in card.labels)
-
-        is_completed = card.is_due_complete
-
-        if is_completed:
+        if card["dueComplete"]:
             return "done"
-        elif has_wip:
+        elif wip_id in card["idLabels"]:
             return "wip"
         else:
             return "todo"
 
     def _should_include_task(self, status, filter_type):
         """Check if a task should be included based on filter."""
-        filter_conditions = {"all": True, "wip": status == "wip", "done": status == "done"}
-        return filter_conditions.get(filter_type, False)
+        return filter_type == "all" or status == STATUS_FOR_FILTER.get(filter_type)
 
     def _generate_result_message(self, filtered_tasks, filter_type, project_name):
         """Generate appropriate result message based on filter and results."""
-        if not filtered_tasks:
-            no_tasks_messages = {
-                "all": f"No tasks found in project '{project_name}'.",
-                "wip": f"No work in progress tasks found in project '{project_name}'.",
-                "done": f"No completed tasks found in project '{project_name}'.",
-            }
-            return no_tasks_messages.get(
-                filter_type, f"No tasks found with filter '{filter_type}' in project '{project_name}'."
-            )
-        else:
-            task_count = len(filtered_tasks)
-            found_tasks_messages = {
-                "all": f"Found {task_count} task(s) in project '{project_name}'.",
-                "wip": f"Found {task_count} work in progress task(s) in project '{project_name}'.",
-                "done": f"Found {task_count} completed task(s) in project '{project_name}'.",
-            }
-            return found_tasks_messages.get(
-                filter_type, f"Found {task_count} task(s) with filter '{filter_type}' in project '{project_name}'"
-            )
+        template = FOUND_TASKS_MESSAGES[filter_type] if filtered_tasks else NO_TASKS_MESSAGES[filter_type]
+        return template.format(task_count=len(filtered_tasks), project_name=project_name)
 
     def _create_default_labels(self):
         try:
@@ -271,23 +465,127 @@ class TrelloTaskManager:
                 else:
                     self.labels[label_name] = existing_labels[label_name]
         except Exception as e:
-            print(f"Error creating default labels: {e}")
+            print(f"Error creating default labels: {e}", file=sys.stderr)
+
+    def _select_board(self):
+        """Look up the configured board by name and set up its default labels."""
+        self.selected_board = next(
+            (board for board in self.client.list_boards() if board.name == self.board_name), None
+        )
+        if self.selected_board:
+            self._create_default_labels()
+        self._save_board_meta()
+
+    def _retry_with_fresh_board_meta(self, operation):
+        """Run `operation`, re-resolving the board and labels once if Trello rejects cached ids.
+
+        A board or label deleted or recreated in Trello since the cache was written
+        would otherwise keep failing until the cache expires.
+        """
+        try:
+            return operation()
+        except ResourceUnavailable:
+            if not self._board_meta_cached:
+                raise
+            print("Cached board or label ids were rejected, looking them up again", file=sys.stderr)
+            self._board_meta_cached = False
+            self.labels = {}
+            self._lists_by_name = None
+            self._list_cache = {}
+            self._select_board()
+            return operation()
+
+    def _load_board_meta(self):
+        """Restore the selected board and default labels from the on-disk cache, if it is fresh."""
+        # Any unexpected shape in the file is treated as a cache miss
+        try:
+            with open(BOARD_META_CACHE_PATH, encoding="utf-8") as f:
+                meta = json.load(f)[self._board_meta_key]
+            if time.time() - meta["saved_at"] > BOARD_META_CACHE_TTL:
+                return False
+            labels = {
+                name: Label(self.client, label_id, name, color) for name, (label_id, color) in meta["labels"].items()
+            }
+            if not DEFAULT_LABELS.keys() <= labels.keys():
+                return False
+            board = Board(client=self.client, board_id=meta["board_id"], name=self.board_name)
+        except (OSError, ValueError, LookupError, TypeError, AttributeError):
+            return False
+
+        self.selected_board = board
+        self.labels = labels
+        return True
+
+    def _save_board_meta(self):
+        """Persist the selected board and default label ids for the next start.
+
+        Drops the entry instead when the board was not found or its labels could not
+        be set up, so the next start looks them up again.
+        """
+        try:
+            with open(BOARD_META_CACHE_PATH, encoding="utf-8") as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            cache = {}
+        if not isinstance(cache, dict):
+            cache = {}
+
+        # Label creation errors are only printed, so never cache a partial label set
+        if self.selected_board and DEFAULT_LABELS.keys() <= self.labels.keys():
+            cache[self._board_meta_key] = {
+                "saved_at": time.time(),
+                "board_id": self.selected_board.id,
+                "labels": {name: [label.id, label.color] for name, label in self.labels.items()},
+            }
+        elif cache.pop(self._board_meta_key, None) is None:
+            return
+        try:
+            os.makedirs(os.path.dirname(BOARD_META_CACHE_PATH), exist_ok=True)
+            with open(BOARD_META_CACHE_PATH, "w", encoding="utf-8") as f:
+                json.dump(cache, f)
+        except OSError as e:
+            print(f"Error saving board cache: {e}", file=sys.stderr)
 
     def _find_existing_list(self, project_name):
-        return next(
-            (board_list for board_list in self.selected_board.all_lists() if board_list.name == project_name), None
+        if self._lists_by_name and time.monotonic() - self._lists_by_name[0] < CARD_CACHE_TTL:
+            board_list = self._lists_by_name[1].get(project_name)
+            if board_list is not None:
+                return board_list
+
+        # Re-read the board on a miss too, in case the list was created elsewhere
+        lists_by_name = {}
+        json_lists = self._retry_with_fresh_board_meta(
+            lambda: self.client.fetch_json(
+                f"/boards/{self.selected_board.id}/lists",
+                query_params={"cards": "none", "filter": "all", "fields": LIST_LOOKUP_FIELDS},
+            )
         )
+        for json_list in json_lists:
+            board_list = List.from_json(self.selected_board, json_list)
+            lists_by_name.setdefault(board_list.name, board_list)
+        self._lists_by_name = (time.monotonic(), lists_by_name)
+        return lists_by_name.get(project_name)
+
+
+@functools.lru_cache(maxsize=1)
+def get_manager():
+    """Return the process-wide TrelloTaskManager, creating it on first use.
+
+    Sharing one instance keeps its HTTP connections, board lookup and card cache
+    alive across tool calls.
+    """
+    return TrelloTaskManager()
 
 
 if __name__ == "__main__":
     # Testing
-    tm = TrelloTaskManager()
+    tm = get_manager()
 
     project_name = "Some Project"
     new_task_title = f"New Task at {datetime.datetime.now()}"
     tm.add_task(project_name, new_task_title, "This is a test task.")
     t1, _ = tm.get_next_task(project_name)
-    print(t1.name)
+    print(t1["name"])
 
     tm.update_task_with_checklist(project_name, new_task_title, ["Item 1", "Item 2", "Item 3"])
     print("Checklist set.")